@@ -4,22 +4,122 @@ Home Buying Readiness Report - PDF Generator
 Generates a beautiful PDF report from calculator results
 """
 
-import json
+import io
 import sys
-from datetime import datetime
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    HRFlowable, KeepTogether
-)
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    import json
+    _loads = json.loads
+
+
+# Verdict category -> closing next steps
+_VERDICT_NEXT_STEPS = {
+    'ready': (
+        "You're ready! Start interviewing real estate agents in your target area",
+        "Get pre-approved with 2-3 lenders to compare rates",
+    ),
+    'almost': (
+        "Consider paying down existing debts to improve your DTI ratio",
+        "Continue saving while monitoring interest rates",
+    ),
+    'not_ready': (
+        "Focus on increasing income or reducing monthly debts",
+        "Consider looking at homes in a lower price range",
+    ),
+}
+
+# Verdict emoji -> glyphs available in the built-in PDF fonts
+_VERDICT_TRANS = str.maketrans({'✅': '✓', '🔶': '⚠', '🔴': '✗'})
+
+
+# Leading verdict emoji -> verdict category
+_FIRST_CHAR_CAT = {'✅': 'ready', '🔶': 'almost', '🔴': 'not_ready'}
+
+
+def _classify_verdict(verdict):
+    """Return the verdict category: 'ready', 'almost' or 'not_ready'."""
+    cat = _FIRST_CHAR_CAT.get(verdict[:1])
+    if cat is not None:
+        return cat
+    # No leading emoji; fall back to scanning for the verdict words.
+    # 'Almost Ready' and 'Not Ready' both contain 'Ready', so check them first.
+    if '✅' in verdict:
+        return 'ready'
+    if '🔶' in verdict or 'Almost' in verdict:
+        return 'almost'
+    if 'Ready' in verdict and 'Not Ready' not in verdict:
+        return 'ready'
+    return 'not_ready'
+
+
+# DTI status labels, in get_dti_color's success/warning/danger/gray order
+_DTI_STATUS = ('✓ Good', '⚠ High', '✗ Too High', 'N/A')
+
+
+def get_dti_color(dti_str, threshold, success, warning, danger, gray):
+    """Return the status value that fits a DTI string such as '31.5%'.
+
+    Callers pass the four status values, e.g. the report colors or the
+    _DTI_STATUS labels, so this needs no reportlab import.
+    """
+    if not isinstance(dti_str, str):
+        return gray
+    try:
+        dti_val = float(dti_str.strip().rstrip('%'))
+    except ValueError:
+        return gray
+    if dti_val <= threshold:
+        return success
+    if dti_val <= threshold + 7:
+        return warning
+    return danger
+
+
+def _money(value):
+    """Format a dollar amount as a whole-dollar string, e.g. $1,234."""
+    return f"${int(float(value or 0)):,}"
+
+
+def _aggregate_debts(car_payment, student_loans, credit_cards, other_debt):
+    """Return (total, table rows) for the already-parsed monthly debts."""
+    total = car_payment + student_loans + credit_cards + other_debt
+    return total, [
+        ['Car Payment(s)', _money(car_payment)],
+        ['Student Loans', _money(student_loans)],
+        ['Credit Card Minimums', _money(credit_cards)],
+        ['Other Debts', _money(other_debt)],
+        ['Total Monthly Debt', _money(total)],
+    ]
+
+
+def _load_pdf_styles():
+    """Import the reportlab styles module that sits next to this file.
+
+    Inside a package the relative import is used. Run as a script or
+    imported as a top-level module, this file's directory must be on
+    sys.path, as it already is for the script and for a plain import.
+    """
+    try:
+        from . import pdf_styles
+    except ImportError:
+        import pdf_styles
+    return pdf_styles
 
 
 def create_pdf_report(data, output_path="home_buying_report.pdf"):
-    """Generate a beautiful PDF report from the calculator data."""
+    """Generate a beautiful PDF report from the calculator data.
+
+    output_path may be a filename or a writable binary file-like object
+    (e.g. io.BytesIO), which is returned as-is once the PDF is written.
+    """
+    # reportlab and the styles load on first use so the helpers above stay cheap to import
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable
+    styles = _load_pdf_styles()
 
     doc = SimpleDocTemplate(
         output_path,
@@ -30,313 +130,158 @@ def create_pdf_report(data, output_path="home_buying_report.pdf"):
         bottomMargin=0.75*inch
     )
 
-    # Define colors
-    primary_color = colors.HexColor("#2563eb")
-    success_color = colors.HexColor("#10b981")
-    warning_color = colors.HexColor("#f59e0b")
-    danger_color = colors.HexColor("#ef4444")
-    gray_color = colors.HexColor("#6b7280")
-    light_gray = colors.HexColor("#f3f4f6")
-    dark_gray = colors.HexColor("#1f2937")
-
-    # Define styles
-    styles = getSampleStyleSheet()
-
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        textColor=primary_color,
-        alignment=TA_CENTER,
-        spaceAfter=6
-    )
-
-    subtitle_style = ParagraphStyle(
-        'Subtitle',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=gray_color,
-        alignment=TA_CENTER,
-        spaceAfter=20
-    )
+    # Pull every field out of the payload once
+    inputs = data.get('inputs') or {}
+    debts = data.get('monthlyDebts') or {}
+    dti = data.get('dti') or {}
 
-    section_header_style = ParagraphStyle(
-        'SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=dark_gray,
-        spaceBefore=20,
-        spaceAfter=10,
-        borderPadding=5
-    )
-
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=dark_gray,
-        spaceAfter=8
-    )
-
-    label_style = ParagraphStyle(
-        'Label',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=gray_color
-    )
-
-    value_style = ParagraphStyle(
-        'Value',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=dark_gray,
-        fontName='Helvetica-Bold'
-    )
-
-    # Build the document
-    story = []
+    generated_at = data.get('generatedAt')
+    if generated_at is None:
+        from datetime import datetime
+        generated_at = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    verdict = data.get('readinessStatus', '')
+    target_price = data.get('targetHomePrice', '0')
+    monthly_payment = data.get('monthlyPayment', 'N/A')
+    down_payment_needed = data.get('downPaymentNeeded', 'N/A')
+    closing_costs = data.get('closingCosts', 'N/A')
+    total_cash_needed = data.get('totalCashNeeded')
 
-    # Header
-    story.append(Paragraph("🏠 Home Buying Readiness Report", title_style))
-    story.append(Paragraph(f"Generated on {data.get('generatedAt', datetime.now().strftime('%B %d, %Y at %I:%M %p'))}", subtitle_style))
+    housing_dti = dti.get('housingDTI', 'N/A')
+    total_dti = dti.get('totalDTI', 'N/A')
 
-    # Divider
-    story.append(HRFlowable(width="100%", thickness=2, color=primary_color, spaceBefore=10, spaceAfter=20))
+    annual_income = inputs.get('annualIncome')
+    additional_income = inputs.get('additionalIncome')
+    credit_score = inputs.get('creditScore')
+    total_savings = inputs.get('totalSavings')
+    monthly_savings = inputs.get('monthlySavings')
+    down_payment_percent = inputs.get('downPaymentPercent', 'N/A')
+    loan_type = inputs.get('loanType', 'N/A')
+    loan_term = inputs.get('loanTerm', 'N/A')
+    interest_rate = inputs.get('interestRate', 'N/A')
+
+    car_payment = float(debts.get('carPayment') or 0)
+    student_loans = float(debts.get('studentLoans') or 0)
+    credit_cards = float(debts.get('creditCards') or 0)
+    other_debt = float(debts.get('otherDebt') or 0)
+
+    # Build the document, starting with the header
+    story = [
+        Paragraph("🏠 Home Buying Readiness Report", styles.TITLE_STYLE),
+        Paragraph(f"Generated on {generated_at}", styles.SUBTITLE_STYLE),
+        # Divider
+        HRFlowable(width="100%", thickness=2, color=styles.PRIMARY_COLOR, spaceBefore=10, spaceAfter=20),
+    ]
 
     # Affordability Verdict Box
-    verdict = data.get('readinessStatus', '')
-    if '✅' in verdict or 'Ready' in verdict:
-        verdict_color = success_color
-        verdict_bg = colors.HexColor("#d1fae5")
-    elif '🔶' in verdict or 'Almost' in verdict:
-        verdict_color = warning_color
-        verdict_bg = colors.HexColor("#fef3c7")
-    else:
-        verdict_color = danger_color
-        verdict_bg = colors.HexColor("#fee2e2")
-
-    verdict_style = ParagraphStyle(
-        'Verdict',
-        parent=styles['Normal'],
-        fontSize=18,
-        textColor=verdict_color,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
+    verdict_cat = _classify_verdict(verdict)
+    verdict_color = styles.VERDICT_COLORS[verdict_cat][0]
 
-    target_price = data.get('targetHomePrice', '0')
-    if target_price and target_price != '0':
-        target_price_formatted = f"${int(float(target_price)):,}"
-    else:
-        target_price_formatted = "N/A"
+    verdict_style = styles.make_verdict_style(verdict_color)
+    target_price_formatted = _money(target_price) if target_price not in (None, '', '0', 0) else 'N/A'
 
     verdict_table = Table(
-        [[Paragraph(f"Target Home Price: {target_price_formatted}", subtitle_style)],
-         [Paragraph(verdict.replace('✅', '✓').replace('🔶', '⚠').replace('🔴', '✗'), verdict_style)]],
+        [[Paragraph(f"Target Home Price: {target_price_formatted}", styles.SUBTITLE_STYLE)],
+         [Paragraph(verdict.translate(_VERDICT_TRANS), verdict_style)]],
         colWidths=[6.5*inch]
     )
-    verdict_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), verdict_bg),
-        ('BOX', (0, 0), (-1, -1), 2, verdict_color),
-        ('TOPPADDING', (0, 0), (-1, -1), 15),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
-        ('LEFTPADDING', (0, 0), (-1, -1), 20),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(verdict_table)
-    story.append(Spacer(1, 20))
+    verdict_table.setStyle(styles.VERDICT_TABLE_STYLES[verdict_cat])
+    story.extend([verdict_table, Spacer(1, 20)])
 
     # Key Results Section
-    story.append(Paragraph("📊 Key Results", section_header_style))
-
     results_data = [
-        ['Monthly Payment', data.get('monthlyPayment', 'N/A')],
-        ['Down Payment Needed', data.get('downPaymentNeeded', 'N/A')],
-        ['Closing Costs (Est.)', data.get('closingCosts', 'N/A')],
-        ['Total Cash Needed', data.get('totalCashNeeded', 'N/A')],
+        ['Monthly Payment', monthly_payment],
+        ['Down Payment Needed', down_payment_needed],
+        ['Closing Costs (Est.)', closing_costs],
+        ['Total Cash Needed', 'N/A' if total_cash_needed is None else total_cash_needed],
     ]
 
     results_table = Table(results_data, colWidths=[3.25*inch, 3.25*inch])
-    results_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), light_gray),
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (0, -1), gray_color),
-        ('TEXTCOLOR', (1, 0), (1, -1), dark_gray),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 15),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#e5e7eb")),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(results_table)
-    story.append(Spacer(1, 20))
+    results_table.setStyle(styles.RESULTS_TABLE_STYLE)
+    story.extend([
+        Paragraph("📊 Key Results", styles.SECTION_HEADER_STYLE),
+        results_table,
+        Spacer(1, 20),
+    ])
 
     # DTI Analysis Section
-    story.append(Paragraph("📈 Debt-to-Income Analysis", section_header_style))
-
-    dti = data.get('dti', {})
-    housing_dti = dti.get('housingDTI', 'N/A')
-    total_dti = dti.get('totalDTI', 'N/A')
-
-    # Determine DTI status colors
-    def get_dti_color(dti_str, threshold):
-        try:
-            dti_val = float(dti_str.replace('%', ''))
-            if dti_val <= threshold:
-                return success_color
-            elif dti_val <= threshold + 7:
-                return warning_color
-            else:
-                return danger_color
-        except:
-            return gray_color
-
-    housing_color = get_dti_color(housing_dti, 28)
-    total_color = get_dti_color(total_dti, 36)
-
     dti_data = [
         ['Metric', 'Your Value', 'Recommended Max', 'Status'],
-        ['Housing DTI', housing_dti, '28%', '✓ Good' if housing_color == success_color else ('⚠ High' if housing_color == warning_color else '✗ Too High')],
-        ['Total DTI', total_dti, '36%', '✓ Good' if total_color == success_color else ('⚠ High' if total_color == warning_color else '✗ Too High')],
+        ['Housing DTI', housing_dti, '28%', get_dti_color(housing_dti, 28, *_DTI_STATUS)],
+        ['Total DTI', total_dti, '36%', get_dti_color(total_dti, 36, *_DTI_STATUS)],
     ]
 
     dti_table = Table(dti_data, colWidths=[1.6*inch, 1.6*inch, 1.6*inch, 1.6*inch])
-    dti_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), primary_color),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), dark_gray),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#e5e7eb")),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(dti_table)
-
-    story.append(Spacer(1, 8))
-    story.append(Paragraph(
-        "<i>Housing DTI: Percentage of income going to housing costs. Total DTI: Percentage including all debts.</i>",
-        ParagraphStyle('Note', parent=normal_style, fontSize=9, textColor=gray_color)
-    ))
-    story.append(Spacer(1, 20))
-
-    # Your Financial Profile Section
-    story.append(Paragraph("💰 Your Financial Profile", section_header_style))
-
-    inputs = data.get('inputs', {})
-
-    income_data = [
-        ['Income Information', ''],
-        ['Annual Gross Income', f"${int(float(inputs.get('annualIncome', 0) or 0)):,}"],
-        ['Additional Income', f"${int(float(inputs.get('additionalIncome', 0) or 0)):,}"],
-        ['Credit Score', inputs.get('creditScore', 'N/A')],
-        ['Total Savings', f"${int(float(inputs.get('totalSavings', 0) or 0)):,}"],
-        ['Monthly Savings Rate', f"${int(float(inputs.get('monthlySavings', 0) or 0)):,}"],
-    ]
-
-    income_table = Table(income_data, colWidths=[3.25*inch, 3.25*inch])
-    income_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), primary_color),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('SPAN', (0, 0), (1, 0)),
-        ('ALIGN', (0, 0), (1, 0), 'CENTER'),
-        ('BACKGROUND', (0, 1), (0, -1), light_gray),
-        ('TEXTCOLOR', (0, 1), (0, -1), gray_color),
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#e5e7eb")),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(income_table)
-    story.append(Spacer(1, 15))
-
-    # Monthly Debts
-    debts = data.get('monthlyDebts', {})
-
-    debts_data = [
-        ['Monthly Debt Payments', ''],
-        ['Car Payment(s)', f"${int(float(debts.get('carPayment', 0) or 0)):,}"],
-        ['Student Loans', f"${int(float(debts.get('studentLoans', 0) or 0)):,}"],
-        ['Credit Card Minimums', f"${int(float(debts.get('creditCards', 0) or 0)):,}"],
-        ['Other Debts', f"${int(float(debts.get('otherDebt', 0) or 0)):,}"],
-    ]
-
-    # Calculate total monthly debt
-    total_debt = sum([
-        float(debts.get('carPayment', 0) or 0),
-        float(debts.get('studentLoans', 0) or 0),
-        float(debts.get('creditCards', 0) or 0),
-        float(debts.get('otherDebt', 0) or 0)
+    dti_table.setStyle(styles.DTI_TABLE_STYLE)
+    story.extend([
+        Paragraph("📈 Debt-to-Income Analysis", styles.SECTION_HEADER_STYLE),
+        dti_table,
+        Spacer(1, 8),
+        Paragraph(
+            "<i>Housing DTI: Percentage of income going to housing costs. Total DTI: Percentage including all debts.</i>",
+            styles.NOTE_STYLE
+        ),
+        Spacer(1, 20),
     ])
-    debts_data.append(['Total Monthly Debt', f"${int(total_debt):,}"])
-
-    debts_table = Table(debts_data, colWidths=[3.25*inch, 3.25*inch])
-    debts_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#7c3aed")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('SPAN', (0, 0), (1, 0)),
-        ('ALIGN', (0, 0), (1, 0), 'CENTER'),
-        ('BACKGROUND', (0, 1), (0, -1), light_gray),
-        ('TEXTCOLOR', (0, 1), (0, -1), gray_color),
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor("#ede9fe")),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#e5e7eb")),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(debts_table)
-    story.append(Spacer(1, 20))
 
-    # Loan Details Section
-    story.append(Paragraph("📋 Loan Configuration", section_header_style))
+    # Your Financial Profile Section; left out only when none of its fields
+    # were supplied (e.g. a blank preview). An explicit 0 still counts.
+    profile_fields = (
+        annual_income, additional_income, credit_score, total_savings, monthly_savings,
+        debts.get('carPayment'), debts.get('studentLoans'), debts.get('creditCards'),
+        debts.get('otherDebt'),
+    )
+    if any(v not in (None, '') for v in profile_fields):
+        income_data = [
+            ['Income Information', ''],
+            ['Annual Gross Income', _money(annual_income)],
+            ['Additional Income', _money(additional_income)],
+            ['Credit Score', 'N/A' if credit_score is None else credit_score],
+            ['Total Savings', _money(total_savings)],
+            ['Monthly Savings Rate', _money(monthly_savings)],
+        ]
+
+        income_table = Table(income_data, colWidths=[3.25*inch, 3.25*inch])
+        income_table.setStyle(styles.INCOME_TABLE_STYLE)
+
+        # Monthly Debts
+        _, debt_rows = _aggregate_debts(
+            car_payment, student_loans, credit_cards, other_debt
+        )
+        debts_data = [['Monthly Debt Payments', '']] + debt_rows
+
+        debts_table = Table(debts_data, colWidths=[3.25*inch, 3.25*inch])
+        debts_table.setStyle(styles.DEBTS_TABLE_STYLE)
+        story.extend([
+            Paragraph("💰 Your Financial Profile", styles.SECTION_HEADER_STYLE),
+            income_table,
+            Spacer(1, 15),
+            debts_table,
+            Spacer(1, 20),
+        ])
 
+    # Loan Details Section
     loan_data = [
-        ['Down Payment', inputs.get('downPaymentPercent', 'N/A')],
-        ['Loan Type', inputs.get('loanType', 'N/A').title()],
-        ['Loan Term', inputs.get('loanTerm', 'N/A')],
-        ['Interest Rate', inputs.get('interestRate', 'N/A')],
+        ['Down Payment', down_payment_percent],
+        ['Loan Type', loan_type.title()],
+        ['Loan Term', loan_term],
+        ['Interest Rate', interest_rate],
     ]
 
     loan_table = Table(loan_data, colWidths=[3.25*inch, 3.25*inch])
-    loan_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), light_gray),
-        ('TEXTCOLOR', (0, 0), (0, -1), gray_color),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#e5e7eb")),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(loan_table)
-    story.append(Spacer(1, 25))
+    loan_table.setStyle(styles.LOAN_TABLE_STYLE)
+    story.extend([
+        Paragraph("📋 Loan Configuration", styles.SECTION_HEADER_STYLE),
+        loan_table,
+        Spacer(1, 25),
+    ])
 
     # Next Steps Section
-    story.append(Paragraph("📝 Recommended Next Steps", section_header_style))
-
     next_steps = []
 
     # Generate personalized next steps based on the data
     try:
-        savings = float(inputs.get('totalSavings', 0) or 0)
-        total_cash = data.get('totalCashNeeded', '$0').replace('$', '').replace(',', '')
+        savings = float(total_savings or 0)
+        total_cash = (total_cash_needed or '$0').replace('$', '').replace(',', '')
         total_cash_float = float(total_cash) if total_cash else 0
 
         if savings < total_cash_float:
@@ -346,72 +291,62 @@ def create_pdf_report(data, output_path="home_buying_report.pdf"):
         pass
 
     try:
-        credit_score = int(inputs.get('creditScore', 0) or 0)
-        if credit_score < 700:
+        credit_value = int(credit_score or 0)
+        if credit_value < 700:
             next_steps.append("Work on improving your credit score above 700 for better interest rates")
-        elif credit_score >= 700:
+        elif credit_value >= 700:
             next_steps.append("Your credit score is good - consider getting pre-approved for a mortgage")
     except:
         pass
 
-    if '✅' in verdict or 'Ready' in verdict:
-        next_steps.append("You're ready! Start interviewing real estate agents in your target area")
-        next_steps.append("Get pre-approved with 2-3 lenders to compare rates")
-    elif '🔶' in verdict or 'Almost' in verdict:
-        next_steps.append("Consider paying down existing debts to improve your DTI ratio")
-        next_steps.append("Continue saving while monitoring interest rates")
-    else:
-        next_steps.append("Focus on increasing income or reducing monthly debts")
-        next_steps.append("Consider looking at homes in a lower price range")
+    next_steps.extend(_VERDICT_NEXT_STEPS[verdict_cat])
 
+    story.append(Paragraph("📝 Recommended Next Steps", styles.SECTION_HEADER_STYLE))
     for i, step in enumerate(next_steps, 1):
-        bullet_style = ParagraphStyle(
-            'Bullet',
-            parent=normal_style,
-            fontSize=11,
-            leftIndent=20,
-            spaceBefore=5,
-            spaceAfter=5
-        )
-        story.append(Paragraph(f"<b>{i}.</b> {step}", bullet_style))
-
+        story.append(Paragraph(f"<b>{i}.</b> {step}", styles.BULLET_STYLE))
     story.append(Spacer(1, 30))
 
     # Footer
-    story.append(HRFlowable(width="100%", thickness=1, color=gray_color, spaceBefore=10, spaceAfter=10))
-
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=gray_color,
-        alignment=TA_CENTER
-    )
-    story.append(Paragraph(
-        "This report is for informational purposes only and does not constitute financial advice.<br/>"
-        "Consult with a mortgage professional for personalized guidance.",
-        footer_style
-    ))
-    story.append(Spacer(1, 10))
-    story.append(Paragraph(
-        "Generated by Home Buying Readiness Calculator",
-        footer_style
-    ))
+    story.extend([
+        HRFlowable(width="100%", thickness=1, color=styles.GRAY_COLOR, spaceBefore=10, spaceAfter=10),
+        Paragraph(
+            "This report is for informational purposes only and does not constitute financial advice.<br/>"
+            "Consult with a mortgage professional for personalized guidance.",
+            styles.FOOTER_STYLE
+        ),
+        Spacer(1, 10),
+        Paragraph(
+            "Generated by Home Buying Readiness Calculator",
+            styles.FOOTER_STYLE
+        ),
+    ])
 
     # Build the PDF
     doc.build(story)
     return output_path
 
 
+def create_pdf_reports(items):
+    """Generate one report per (data, output_path) pair.
+
+    Styles are shared across the batch, so each report only pays for
+    assembling its story and building the document.
+    """
+    return [create_pdf_report(data, output_path) for data, output_path in items]
+
+
 if __name__ == "__main__":
     # Read JSON data from stdin or file
     if len(sys.argv) > 1:
-        with open(sys.argv[1], 'r') as f:
-            data = json.load(f)
+        with open(sys.argv[1], 'rb') as f:
+            data = _loads(f.read())
         output_path = sys.argv[2] if len(sys.argv) > 2 else "home_buying_report.pdf"
     else:
-        data = json.load(sys.stdin)
+        data = _loads(sys.stdin.buffer.read())
         output_path = "home_buying_report.pdf"
 
-    create_pdf_report(data, output_path)
+    # Render in memory first so a failed build never truncates an existing PDF
+    pdf = create_pdf_report(data, io.BytesIO())
+    with open(output_path, 'wb') as fh:
+        fh.write(pdf.getbuffer())
     print(f"PDF generated: {output_path}")
@@ -0,0 +1,223 @@
+"""
+Home Buying Readiness Report - PDF Styles
+Colors, paragraph styles and table styles shared by every report.
+
+Kept apart from generate_pdf so the report helpers can be imported
+without loading reportlab; generate_pdf imports this module on first use.
+"""
+
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+from reportlab.lib.enums import TA_CENTER
+
+
+# Colors
+PRIMARY_COLOR = colors.HexColor("#2563eb")
+SUCCESS_COLOR = colors.HexColor("#10b981")
+WARNING_COLOR = colors.HexColor("#f59e0b")
+DANGER_COLOR = colors.HexColor("#ef4444")
+GRAY_COLOR = colors.HexColor("#6b7280")
+LIGHT_GRAY = colors.HexColor("#f3f4f6")
+DARK_GRAY = colors.HexColor("#1f2937")
+GRID_COLOR = colors.HexColor("#e5e7eb")
+VIOLET = colors.HexColor("#7c3aed")
+LIGHT_VIOLET = colors.HexColor("#ede9fe")
+SUCCESS_BG = colors.HexColor("#d1fae5")
+WARNING_BG = colors.HexColor("#fef3c7")
+DANGER_BG = colors.HexColor("#fee2e2")
+
+# Styles (built once at import and shared by every report)
+_STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=28,
+    textColor=PRIMARY_COLOR,
+    alignment=TA_CENTER,
+    spaceAfter=6
+)
+
+SUBTITLE_STYLE = ParagraphStyle(
+    'Subtitle',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    textColor=GRAY_COLOR,
+    alignment=TA_CENTER,
+    spaceAfter=20
+)
+
+SECTION_HEADER_STYLE = ParagraphStyle(
+    'SectionHeader',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    textColor=DARK_GRAY,
+    spaceBefore=20,
+    spaceAfter=10,
+    borderPadding=5
+)
+
+NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    textColor=DARK_GRAY,
+    spaceAfter=8
+)
+
+LABEL_STYLE = ParagraphStyle(
+    'Label',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    textColor=GRAY_COLOR
+)
+
+VALUE_STYLE = ParagraphStyle(
+    'Value',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    textColor=DARK_GRAY,
+    fontName='Helvetica-Bold'
+)
+
+VERDICT_STYLE = ParagraphStyle(
+    'Verdict',
+    parent=_STYLES['Normal'],
+    fontSize=18,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+BULLET_STYLE = ParagraphStyle(
+    'Bullet',
+    parent=NORMAL_STYLE,
+    fontSize=11,
+    leftIndent=20,
+    spaceBefore=5,
+    spaceAfter=5
+)
+
+NOTE_STYLE = ParagraphStyle(
+    'Note',
+    parent=NORMAL_STYLE,
+    fontSize=9,
+    textColor=GRAY_COLOR
+)
+
+FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=GRAY_COLOR,
+    alignment=TA_CENTER
+)
+
+# Table styles
+RESULTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), LIGHT_GRAY),
+    ('BACKGROUND', (1, 0), (1, -1), colors.white),
+    ('TEXTCOLOR', (0, 0), (0, -1), GRAY_COLOR),
+    ('TEXTCOLOR', (1, 0), (1, -1), DARK_GRAY),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+DTI_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), DARK_GRAY),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+INCOME_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('SPAN', (0, 0), (1, 0)),
+    ('ALIGN', (0, 0), (1, 0), 'CENTER'),
+    ('BACKGROUND', (0, 1), (0, -1), LIGHT_GRAY),
+    ('TEXTCOLOR', (0, 1), (0, -1), GRAY_COLOR),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+DEBTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), VIOLET),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('SPAN', (0, 0), (1, 0)),
+    ('ALIGN', (0, 0), (1, 0), 'CENTER'),
+    ('BACKGROUND', (0, 1), (0, -1), LIGHT_GRAY),
+    ('TEXTCOLOR', (0, 1), (0, -1), GRAY_COLOR),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, -1), (-1, -1), LIGHT_VIOLET),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+LOAN_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), LIGHT_GRAY),
+    ('TEXTCOLOR', (0, 0), (0, -1), GRAY_COLOR),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+
+def _verdict_table_style(background, border):
+    """Build the verdict box style for one background/border pair."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), background),
+        ('BOX', (0, 0), (-1, -1), 2, border),
+        ('TOPPADDING', (0, 0), (-1, -1), 15),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
+        ('LEFTPADDING', (0, 0), (-1, -1), 20),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
+
+# Verdict category -> (text/border color, box background)
+VERDICT_COLORS = {
+    'ready': (SUCCESS_COLOR, SUCCESS_BG),
+    'almost': (WARNING_COLOR, WARNING_BG),
+    'not_ready': (DANGER_COLOR, DANGER_BG),
+}
+
+# One prebuilt verdict box style per verdict category
+VERDICT_TABLE_STYLES = {
+    cat: _verdict_table_style(bg, color)
+    for cat, (color, bg) in VERDICT_COLORS.items()
+}
+
+def make_verdict_style(color):
+    """Clone the verdict template with the color for this verdict."""
+    return ParagraphStyle('Verdict', parent=VERDICT_STYLE, textColor=color)